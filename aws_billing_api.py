@@ -5,10 +5,28 @@ AWS Billing API - A Python API for accessing AWS billing information based on da
 
 import boto3
 import datetime
-from dateutil.relativedelta import relativedelta
-from typing import Dict, List, Union, Optional, Any
+import functools
+import hashlib
+import json
+import os
+import threading
+from botocore.config import Config
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Dict, List, Sequence, Tuple, Union, Optional, Any
 import logging
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,23 +34,440 @@ logging.basicConfig(
 )
 logger = logging.getLogger('aws_billing_api')
 
+# Client configuration for Cost Explorer: a connection pool large enough for
+# concurrent callers, adaptive (client-side rate limited) retries for throttling,
+# and bounded timeouts so a stalled connection cannot hang a request.
+_CE_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=30,
+    tcp_keepalive=True
+)
+
+# Response keys whose list values are split across NextPageToken pages
+_PAGED_KEYS = ('ResultsByTime', 'DimensionValueAttributes')
+
+# Seconds a persisted response is kept when its time period has not ended yet or
+# any of its results are still Estimated. Final results are kept indefinitely.
+_OPEN_PERIOD_DISK_TTL = 3600
+
+# Longest time period Cost Explorer accepts in a single HOURLY request
+_HOURLY_MAX_DAYS = 14
+
+# Time period bound format for HOURLY requests that start or end within a day
+_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Fixed GroupBy arguments for the per-dimension helpers. These are shared
+# between calls and must not be mutated.
+_GROUP_BY_SERVICE = [{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
+_GROUP_BY_ACCOUNT = [{'Type': 'DIMENSION', 'Key': 'LINKED_ACCOUNT'}]
+_GROUP_BY_REGION = [{'Type': 'DIMENSION', 'Key': 'REGION'}]
+_GROUP_BY_RESOURCE_ID = [{'Type': 'DIMENSION', 'Key': 'RESOURCE_ID'}]
+_GROUP_BY_USAGE_TYPE = [{'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'}]
+
+# Metrics requested for per-resource utilization queries
+_UTILIZATION_METRICS = [
+    "BlendedCost",
+    "UnblendedCost",
+    "UsageQuantity",
+    "NormalizedUsageAmount"
+]
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize obj to compact JSON with sorted keys, using orjson when it is installed.
+    
+    The stdlib fallback uses the same separators and, like orjson, writes non-ASCII
+    characters (e.g. in tag values) as raw UTF-8, so plain data serializes to the
+    same bytes either way and cache keys stay stable across environments.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str).encode()
+
+
+def _loads(blob: Union[bytes, str]) -> Any:
+    """Deserialize JSON produced by _dumps, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def _merge_page(merged: Optional[Dict[str, Any]], response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fold one NextPageToken page into the response accumulated so far.
+    
+    The first page becomes the merged response; later pages only contribute
+    the entries of the paged list keys.
+    """
+    if merged is None:
+        for key in _PAGED_KEYS:
+            if key in response:
+                response[key] = list(response[key])
+        return response
+    for key in _PAGED_KEYS:
+        if key in merged:
+            merged[key].extend(response.get(key, []))
+    return merged
+
+
+def _build_cost_and_usage_params(
+    start_date: Union[str, datetime.date],
+    end_date: Union[str, datetime.date],
+    granularity: str,
+    metrics: Optional[List[str]],
+    group_by: Optional[List[Dict[str, str]]],
+    filter_expression: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Build GetCostAndUsage request parameters, applying the default metrics."""
+    # Default metrics if none provided
+    if metrics is None:
+        metrics = ["BlendedCost", "UnblendedCost", "UsageQuantity"]
+        
+    # Prepare request parameters
+    params = {
+        'TimePeriod': {
+            'Start': start_date,
+            'End': end_date
+        },
+        'Granularity': granularity,
+        'Metrics': metrics
+    }
+    
+    # Add optional parameters if provided
+    if group_by:
+        params['GroupBy'] = group_by
+        
+    if filter_expression:
+        params['Filter'] = filter_expression
+        
+    return params
+
+
+def _iso(value: Union[str, datetime.date]) -> str:
+    """
+    Normalize a date argument to a 'YYYY-MM-DD' string.
+    
+    Strings are passed through unchanged; date and datetime objects are
+    truncated to the day, so inputs within the same day share a cache key.
+    """
+    return value if isinstance(value, str) else value.strftime('%Y-%m-%d')
+
+
+def _to_date(value: Union[str, datetime.date]) -> datetime.date:
+    """Convert a date argument ('YYYY-MM-DD...' string, date or datetime) to a datetime.date."""
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value[:10])
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return value
+
+
+def _to_datetime(value: Union[str, datetime.date]) -> datetime.datetime:
+    """
+    Convert a date argument to a UTC datetime, keeping the time of day of timestamps.
+    
+    Plain dates map to midnight, so 'YYYY-MM-DD' and 'YYYY-MM-DDTHH:MM:SSZ'
+    bounds (as used for sub-day HOURLY periods) compare correctly.
+    """
+    if isinstance(value, str):
+        if len(value) <= 10:
+            value = datetime.date.fromisoformat(value)
+        else:
+            # fromisoformat only accepts the 'Z' suffix from Python 3.11
+            value = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.combine(value, datetime.time())
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value.astimezone(datetime.timezone.utc)
+
+
+def _validate_range(
+    start_date: Union[str, datetime.date],
+    end_date: Union[str, datetime.date],
+    granularity: Optional[str] = None,
+    forecast: bool = False
+) -> None:
+    """
+    Reject time periods Cost Explorer would refuse, before making a billed request.
+    
+    Raises:
+        ValueError: If the dates are malformed, the period is empty, an HOURLY
+            period exceeds _HOURLY_MAX_DAYS days, or a forecast starts in the past.
+    """
+    start, end = _to_datetime(start_date), _to_datetime(end_date)
+    if start >= end:
+        raise ValueError(f"Start date {start_date} must be before end date {end_date} (the end date is exclusive)")
+    if granularity == 'HOURLY' and end - start > datetime.timedelta(days=_HOURLY_MAX_DAYS):
+        raise ValueError(f"HOURLY granularity supports at most {_HOURLY_MAX_DAYS} days per request")
+    if forecast and start.date() < datetime.date.today():
+        raise ValueError(f"Forecast start date {start_date} must not be in the past")
+
+
+def _is_timestamp(value: Union[str, datetime.date]) -> bool:
+    """Return True if a date argument carries a time of day (a datetime or a 'YYYY-MM-DDTHH:MM:SSZ' string)."""
+    return isinstance(value, datetime.datetime) or (isinstance(value, str) and len(value) > 10)
+
+
+def _chunk_dates(start: datetime.date, end: datetime.date, max_days: int):
+    """
+    Split the period [start, end) into consecutive windows of at most max_days days.
+    
+    Works on dates and datetimes alike; datetime windows keep the time of day.
+    
+    Yields:
+        (chunk_start, chunk_end) pairs in chronological order
+    """
+    step = datetime.timedelta(days=max_days)
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + step, end)
+        yield chunk_start, chunk_end
+        chunk_start = chunk_end
+
+
+def _hourly_windows(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Split GetCostAndUsage parameters into the requests needed to cover their period.
+    
+    An HOURLY period longer than Cost Explorer allows becomes one request per
+    window of at most _HOURLY_MAX_DAYS days; anything else is a single request.
+    Window bounds use the caller's format, so timestamps keep their time of day.
+    """
+    if params['Granularity'] == 'HOURLY':
+        time_period = params['TimePeriod']
+        start, end = _to_datetime(time_period['Start']), _to_datetime(time_period['End'])
+        if end - start > datetime.timedelta(days=_HOURLY_MAX_DAYS):
+            if _is_timestamp(time_period['Start']) or _is_timestamp(time_period['End']):
+                bound_format = _TIMESTAMP_FORMAT
+            else:
+                bound_format = '%Y-%m-%d'
+            return [
+                dict(params, TimePeriod={
+                    'Start': chunk_start.strftime(bound_format),
+                    'End': chunk_end.strftime(bound_format)
+                })
+                for chunk_start, chunk_end in _chunk_dates(start, end, _HOURLY_MAX_DAYS)
+            ]
+    return [params]
+
+
+def _stitch_windows(responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Join the responses of consecutive windows into one, in chronological order."""
+    merged = responses[0]
+    for key in _PAGED_KEYS:
+        if key in merged:
+            merged[key] = [item for response in responses for item in response.get(key, [])]
+    return merged
+
+
+def _prepare_request(op_name: str, params: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Normalize the TimePeriod dates of a request in place and validate the period.
+    
+    Shared by the sync and async clients so both send and reject the same requests.
+    Bounds are normally sent as 'YYYY-MM-DD' dates; an HOURLY period with a time
+    of day on either bound is sent as a pair of UTC 'YYYY-MM-DDTHH:MM:SSZ' timestamps.
+    
+    Returns:
+        The normalized (start, end) date strings
+        
+    Raises:
+        ValueError: If Cost Explorer would refuse the period (see _validate_range)
+    """
+    time_period = params['TimePeriod']
+    start, end = time_period['Start'], time_period['End']
+    granularity = params.get('Granularity')
+    if granularity == 'HOURLY' and (_is_timestamp(start) or _is_timestamp(end)):
+        # _iso would truncate datetimes to the day and empty a sub-day period
+        start_date = _to_datetime(start).strftime(_TIMESTAMP_FORMAT)
+        end_date = _to_datetime(end).strftime(_TIMESTAMP_FORMAT)
+    else:
+        start_date, end_date = _iso(start), _iso(end)
+    params['TimePeriod'] = {'Start': start_date, 'End': end_date}
+    _validate_range(
+        start_date,
+        end_date,
+        granularity,
+        forecast=(op_name == 'get_cost_forecast')
+    )
+    return start_date, end_date
+
+
+# Serializes lazy client creation: lru_cache does not deduplicate concurrent
+# misses, and creating clients on a shared boto3 session is not thread-safe
+_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_session(profile_name: Optional[str], region_name: str) -> boto3.Session:
+    """Return a boto3 session shared by every API instance with the same profile and region."""
+    return boto3.Session(profile_name=profile_name, region_name=region_name)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_ce_client(profile_name: Optional[str], region_name: str):
+    """
+    Return a Cost Explorer client shared by every API instance with the same profile and region.
+    
+    Session construction dominates client setup cost, and low-level botocore
+    clients are thread-safe, so one client per profile/region is reused.
+    """
+    return _get_session(profile_name, region_name).client('ce', config=_CE_CLIENT_CONFIG)
+
 
 class AWSBillingAPI:
     """
     API for accessing AWS billing information based on date range.
     """
     
-    def __init__(self, profile_name: Optional[str] = None, region_name: str = 'us-east-1'):
+    def __init__(
+        self,
+        profile_name: Optional[str] = None,
+        region_name: str = 'us-east-1',
+        cache_ttl: int = 300,
+        disk_cache_dir: Optional[str] = None,
+        disk_cache_ttl: int = _OPEN_PERIOD_DISK_TTL,
+        disk_cache_final_ttl: Optional[int] = None
+    ):
         """
         Initialize the AWS Billing API.
         
         Args:
             profile_name: AWS profile name to use. If None, default profile is used.
             region_name: AWS region name to use.
+            cache_ttl: Seconds to reuse the response of an identical cost query. 0 disables caching.
+            disk_cache_dir: Directory to persist responses in across processes (requires diskcache).
+                If None, responses are only cached in memory.
+            disk_cache_ttl: Seconds to persist a response whose period has not ended yet or
+                is still Estimated.
+            disk_cache_final_ttl: Seconds to persist a final response. If None, final
+                responses are persisted indefinitely.
         """
-        self.session = boto3.Session(profile_name=profile_name, region_name=region_name)
-        self.ce_client = self.session.client('ce')  # Cost Explorer client
-        logger.info(f"Initialized AWS Billing API with region: {region_name}")
+        self.profile_name = profile_name
+        self.region_name = region_name
+        # The session and client are created on first use (see ce_client)
+        self._ce_client = None
+        self._executor = ThreadPoolExecutor(max_workers=10)
+        # Identical queries are answered from memory; each Cost Explorer request is billed
+        self._cache = TTLCache(maxsize=512, ttl=cache_ttl) if cache_ttl else None
+        self._cache_lock = threading.Lock()
+        self._disk_cache = None
+        self._disk_cache_ttl = disk_cache_ttl
+        self._disk_cache_final_ttl = disk_cache_final_ttl
+        if disk_cache_dir is not None:
+            if diskcache is None:
+                raise ImportError("disk_cache_dir requires diskcache; install it with 'pip install diskcache'")
+            self._disk_cache = diskcache.Cache(os.path.expanduser(disk_cache_dir))
+        logger.info("Initialized AWS Billing API with region: %s", region_name)
+    
+    @property
+    def session(self) -> boto3.Session:
+        """
+        The boto3 session for this profile and region, created on first access.
+        
+        The session is shared by every instance with the same profile and region,
+        and boto3 sessions are not thread-safe: create clients from it on one thread only.
+        """
+        return _get_session(self.profile_name, self.region_name)
+    
+    @property
+    def ce_client(self):
+        """
+        The Cost Explorer client, created on first access.
+        
+        Deferring creation keeps construction cheap (e.g. on a Lambda cold start
+        whose queries are all served from the disk cache). The client is shared by
+        all worker threads and by every instance with the same profile and region.
+        """
+        if self._ce_client is None:
+            # The first access may come from several executor workers at once
+            with _client_lock:
+                if self._ce_client is None:
+                    self._ce_client = _get_ce_client(self.profile_name, self.region_name)
+        return self._ce_client
+    
+    @ce_client.setter
+    def ce_client(self, client) -> None:
+        self._ce_client = client
+    
+    def _invoke(self, op_name: str, **params) -> Dict[str, Any]:
+        """
+        Call a Cost Explorer operation and return its complete response.
+        
+        Normalizes and validates the TimePeriod dates, serves identical requests from the
+        in-memory cache (then the disk cache, if enabled), and follows NextPageToken (Cost Explorer has no boto3
+        paginator for these operations), merging every page into one response.
+        
+        Args:
+            op_name: Name of the Cost Explorer client method, e.g. 'get_cost_and_usage'
+            **params: Request parameters for the operation
+            
+        Returns:
+            Dict containing the merged response
+        """
+        start_date, end_date = _prepare_request(op_name, params)
+        
+        request_json = _dumps(params)
+        cache_key = (op_name, request_json)
+        if self._cache is not None:
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Cache hit for %s from %s to %s", op_name, start_date, end_date)
+                # Decoded per hit, so callers never share (and mutate) a cached response
+                return _loads(cached)
+        
+        disk_key = None
+        if self._disk_cache is not None:
+            # Scoped to the profile and region: one cache directory may be shared
+            # by instances that read different accounts' billing data
+            scope = f"{self.profile_name}:{self.region_name}:{op_name}:".encode()
+            disk_key = hashlib.sha256(scope + request_json).hexdigest()
+            blob = self._disk_cache.get(disk_key)
+            if blob is not None:
+                logger.debug("Disk cache hit for %s from %s to %s", op_name, start_date, end_date)
+                if self._cache is not None:
+                    with self._cache_lock:
+                        self._cache[cache_key] = blob
+                return _loads(blob)
+        
+        try:
+            logger.info("Calling %s from %s to %s", op_name, start_date, end_date)
+            method = getattr(self.ce_client, op_name)
+            merged = None
+            next_token = None
+            while True:
+                if next_token:
+                    params['NextPageToken'] = next_token
+                response = method(**params)
+                merged = _merge_page(merged, response)
+                next_token = response.get('NextPageToken')
+                if not next_token:
+                    break
+            merged.pop('NextPageToken', None)
+        except Exception:
+            logger.exception("Error calling %s", op_name)
+            raise
+        
+        blob = _dumps(merged)
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache[cache_key] = blob
+        if disk_key is not None:
+            # Recent periods stay Estimated (and get revised) for a while after they end
+            final = _to_date(end_date) < datetime.date.today() and not any(
+                result.get('Estimated') for result in merged.get('ResultsByTime', [])
+            )
+            self._disk_cache.set(
+                disk_key,
+                blob,
+                expire=self._disk_cache_final_ttl if final else self._disk_cache_ttl
+            )
+        return merged
         
     def get_cost_and_usage(
         self, 
@@ -55,42 +490,51 @@ class AWSBillingAPI:
             filter_expression: Cost Explorer filter expression
             
         Returns:
-            Dict containing the cost and usage data
+            Dict containing the cost and usage data, with all result pages merged
         """
-        # Convert datetime objects to strings if needed
-        if isinstance(start_date, datetime.date):
-            start_date = start_date.strftime('%Y-%m-%d')
-        if isinstance(end_date, datetime.date):
-            end_date = end_date.strftime('%Y-%m-%d')
-            
-        # Default metrics if none provided
-        if metrics is None:
-            metrics = ["BlendedCost", "UnblendedCost", "UsageQuantity"]
-            
-        # Prepare request parameters
-        params = {
-            'TimePeriod': {
-                'Start': start_date,
-                'End': end_date
-            },
-            'Granularity': granularity,
-            'Metrics': metrics
-        }
+        params = _build_cost_and_usage_params(
+            start_date, end_date, granularity, metrics, group_by, filter_expression
+        )
         
-        # Add optional parameters if provided
-        if group_by:
-            params['GroupBy'] = group_by
-            
-        if filter_expression:
-            params['Filter'] = filter_expression
+        windows = _hourly_windows(params)
+        if len(windows) == 1:
+            return self._invoke('get_cost_and_usage', **params)
+        
+        futures = [self._executor.submit(self._invoke, 'get_cost_and_usage', **window) for window in windows]
+        return _stitch_windows([future.result() for future in futures])
+    
+    def get_cost_and_usage_with_resources(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        filter_expression: Dict[str, Any],
+        granularity: str = 'DAILY',
+        metrics: List[str] = None,
+        group_by: List[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get resource-level cost and usage data for the specified date range.
+        
+        Calls GetCostAndUsageWithResources, the only operation that accepts
+        RESOURCE_ID as a filter or group-by dimension. Cost Explorer keeps
+        resource-level data for the last 14 days only, and it must be enabled
+        in the Cost Explorer settings.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object (at most 14 days ago)
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            filter_expression: Cost Explorer filter expression (required by this operation)
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+            metrics: List of metrics to include (defaults to ["BlendedCost", "UnblendedCost", "UsageQuantity"])
+            group_by: List of grouping dimensions
             
-        try:
-            logger.info(f"Requesting cost and usage data from {start_date} to {end_date}")
-            response = self.ce_client.get_cost_and_usage(**params)
-            return response
-        except Exception as e:
-            logger.error(f"Error getting cost and usage data: {str(e)}")
-            raise
+        Returns:
+            Dict containing the resource-level cost and usage data, with all result pages merged
+        """
+        params = _build_cost_and_usage_params(
+            start_date, end_date, granularity, metrics, group_by, filter_expression
+        )
+        return self._invoke('get_cost_and_usage_with_resources', **params)
     
     def get_cost_by_service(
         self, 
@@ -109,12 +553,11 @@ class AWSBillingAPI:
         Returns:
             Dict containing the cost data grouped by service
         """
-        group_by = [{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
         return self.get_cost_and_usage(
             start_date=start_date,
             end_date=end_date,
             granularity=granularity,
-            group_by=group_by
+            group_by=_GROUP_BY_SERVICE
         )
     
     def get_cost_by_account(
@@ -134,12 +577,11 @@ class AWSBillingAPI:
         Returns:
             Dict containing the cost data grouped by account
         """
-        group_by = [{'Type': 'DIMENSION', 'Key': 'LINKED_ACCOUNT'}]
         return self.get_cost_and_usage(
             start_date=start_date,
             end_date=end_date,
             granularity=granularity,
-            group_by=group_by
+            group_by=_GROUP_BY_ACCOUNT
         )
     
     def get_cost_by_region(
@@ -159,7 +601,84 @@ class AWSBillingAPI:
         Returns:
             Dict containing the cost data grouped by region
         """
-        group_by = [{'Type': 'DIMENSION', 'Key': 'REGION'}]
+        return self.get_cost_and_usage(
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            group_by=_GROUP_BY_REGION
+        )
+    
+    def get_cost_breakdowns(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        dimensions: Sequence[str] = ('SERVICE', 'LINKED_ACCOUNT', 'REGION'),
+        granularity: str = 'MONTHLY'
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cost data grouped by each of several dimensions, fetched concurrently.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            dimensions: Cost Explorer dimension keys to group by, one request each
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+            
+        Returns:
+            Dict mapping each dimension to its cost and usage response
+        """
+        # Every window of every dimension is submitted from this thread: a worker
+        # that blocked on further executor tasks could starve the pool
+        futures = {
+            dimension: [
+                self._executor.submit(self._invoke, 'get_cost_and_usage', **window)
+                for window in _hourly_windows(_build_cost_and_usage_params(
+                    start_date,
+                    end_date,
+                    granularity,
+                    None,
+                    [{'Type': 'DIMENSION', 'Key': dimension}],
+                    None
+                ))
+            ]
+            for dimension in dimensions
+        }
+        
+        return {
+            dimension: _stitch_windows([future.result() for future in dimension_futures])
+            for dimension, dimension_futures in futures.items()
+        }
+    
+    def get_cost_cross_tab(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        keys: Sequence[str] = ('SERVICE', 'LINKED_ACCOUNT'),
+        granularity: str = 'MONTHLY'
+    ) -> Dict[str, Any]:
+        """
+        Get cost data grouped by two dimensions at once in a single request.
+        
+        Each group in the response carries one value per key (e.g. service and
+        account), so the caller can pivot client-side instead of issuing one
+        request per dimension. Cost Explorer allows at most two group-by keys;
+        for more dimensions use get_cost_breakdowns.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            keys: One or two Cost Explorer dimension keys to group by
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+            
+        Returns:
+            Dict containing the cost data grouped by the given dimensions
+        """
+        if not 1 <= len(keys) <= 2:
+            raise ValueError(
+                f"Cost Explorer supports one or two group-by keys, got {len(keys)}; "
+                "use get_cost_breakdowns for more dimensions"
+            )
+        group_by = [{'Type': 'DIMENSION', 'Key': key} for key in keys]
         return self.get_cost_and_usage(
             start_date=start_date,
             end_date=end_date,
@@ -186,9 +705,6 @@ class AWSBillingAPI:
         Returns:
             Dict containing the cost data grouped by resource ID
         """
-        # Group by resource ID
-        group_by = [{'Type': 'DIMENSION', 'Key': 'RESOURCE_ID'}]
-        
         # Filter by specific resource IDs if provided
         filter_expression = None
         if resource_ids:
@@ -203,7 +719,7 @@ class AWSBillingAPI:
             start_date=start_date,
             end_date=end_date,
             granularity=granularity,
-            group_by=group_by,
+            group_by=_GROUP_BY_RESOURCE_ID,
             filter_expression=filter_expression
         )
     
@@ -269,30 +785,23 @@ class AWSBillingAPI:
         Returns:
             Dict containing the cost forecast data
         """
-        # Convert datetime objects to strings if needed
-        if isinstance(start_date, datetime.date):
-            start_date = start_date.strftime('%Y-%m-%d')
-        if isinstance(end_date, datetime.date):
-            end_date = end_date.strftime('%Y-%m-%d')
-            
-        try:
-            logger.info(f"Requesting cost forecast from {start_date} to {end_date}")
-            response = self.ce_client.get_cost_forecast(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity=granularity,
-                Metric=metric
-            )
-            return response
-        except Exception as e:
-            logger.error(f"Error getting cost forecast: {str(e)}")
-            raise
+        return self._invoke(
+            'get_cost_forecast',
+            TimePeriod={
+                'Start': start_date,
+                'End': end_date
+            },
+            Granularity=granularity,
+            Metric=metric
+        )
     
     def get_monthly_cost_summary(self, months_back: int = 6) -> Dict[str, Any]:
         """
-        Get a summary of costs for the last N months.
+        Get a summary of costs for the last N complete calendar months.
+        
+        The period runs from the first day of the month N months ago up to the
+        first day of the current month, so the request (and its cache key) stays
+        the same for the whole month.
         
         Args:
             months_back: Number of months to look back
@@ -300,8 +809,10 @@ class AWSBillingAPI:
         Returns:
             Dict containing monthly cost summary
         """
-        end_date = datetime.date.today()
-        start_date = end_date - relativedelta(months=months_back)
+        today = datetime.date.today()
+        end_date = today.replace(day=1)
+        year, month_index = divmod(today.year * 12 + today.month - 1 - months_back, 12)
+        start_date = datetime.date(year, month_index + 1, 1)
         
         return self.get_cost_and_usage(
             start_date=start_date,
@@ -335,13 +846,11 @@ class AWSBillingAPI:
                 }
             }
             
-        group_by = [{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
-        
         return self.get_cost_and_usage(
             start_date=start_date,
             end_date=end_date,
             granularity='MONTHLY',
-            group_by=group_by,
+            group_by=_GROUP_BY_SERVICE,
             filter_expression=filter_expression
         )
     
@@ -372,18 +881,165 @@ class AWSBillingAPI:
             }
         }
         
-        # Get more detailed metrics for this resource
-        metrics = [
-            "BlendedCost", 
-            "UnblendedCost", 
-            "UsageQuantity",
-            "NormalizedUsageAmount"
-        ]
-        
         return self.get_cost_and_usage(
             start_date=start_date,
             end_date=end_date,
             granularity=granularity,
-            metrics=metrics,
+            metrics=_UTILIZATION_METRICS,
             filter_expression=filter_expression
-        )
\ No newline at end of file
+        )
+    
+    def get_many_resource_utilization(
+        self,
+        resource_ids: List[str],
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        granularity: str = 'DAILY'
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get detailed utilization and cost data for several resources in a single request.
+        
+        Issues one GetCostAndUsageWithResources request filtered to all of the IDs
+        and grouped by resource ID, so the period must start within the last 14
+        days (see get_cost_and_usage_with_resources).
+        
+        Args:
+            resource_ids: The resource IDs to analyze
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+            
+        Returns:
+            Dict mapping each resource ID to its time series, a list of
+            {'TimePeriod', 'Metrics'} entries (empty if the resource had no usage)
+        """
+        response = self.get_cost_and_usage_with_resources(
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            metrics=_UTILIZATION_METRICS,
+            group_by=_GROUP_BY_RESOURCE_ID,
+            filter_expression={
+                'Dimensions': {
+                    'Key': 'RESOURCE_ID',
+                    'Values': list(resource_ids)
+                }
+            }
+        )
+        
+        series = {resource_id: [] for resource_id in resource_ids}
+        for result in response.get('ResultsByTime', []):
+            time_period = result.get('TimePeriod', {})
+            for group in result.get('Groups', []):
+                resource_id = group.get('Keys', ['Unknown'])[0]
+                series.setdefault(resource_id, []).append({
+                    'TimePeriod': time_period,
+                    'Metrics': group.get('Metrics', {})
+                })
+        return series
+    
+    def get_resource_bundle(
+        self,
+        resource_id: str,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        granularity: str = 'DAILY'
+    ) -> Dict[str, Any]:
+        """
+        Get the cost, usage and per-usage-type breakdown of one resource in a single request.
+        
+        Replaces separate get_resource_utilization and get_cost_by_resource_id
+        calls for the same resource: one request filtered to the resource and
+        grouped by usage type carries both the breakdown and, summed, the totals.
+        Like get_many_resource_utilization, it uses GetCostAndUsageWithResources, so
+        the period must start within the last 14 days.
+        
+        Args:
+            resource_id: The specific resource ID to analyze
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+            
+        Returns:
+            Dict with 'ResourceId', 'Total' (metric -> {'Amount', 'Unit'}),
+            'ByUsageType' (usage type -> metric -> {'Amount', 'Unit'}) summed over
+            the period, and the raw 'ResultsByTime'. A sum over mixed units (usage
+            metrics across usage types) has the unit 'N/A'
+        """
+        response = self.get_cost_and_usage_with_resources(
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            metrics=_UTILIZATION_METRICS,
+            group_by=_GROUP_BY_USAGE_TYPE,
+            filter_expression={
+                'Dimensions': {
+                    'Key': 'RESOURCE_ID',
+                    'Values': [resource_id]
+                }
+            }
+        )
+        
+        # Sum with Decimal: amounts arrive as strings and float sums drift
+        totals = {}
+        by_usage_type = {}
+        for result in response.get('ResultsByTime', []):
+            for group in result.get('Groups', []):
+                usage_type = group.get('Keys', ['Unknown'])[0]
+                usage_totals = by_usage_type.setdefault(usage_type, {})
+                for metric, value in group.get('Metrics', {}).items():
+                    amount = Decimal(value.get('Amount', '0'))
+                    unit = value.get('Unit')
+                    for bucket in (totals, usage_totals):
+                        entry = bucket.setdefault(metric, {'Amount': Decimal(0), 'Unit': unit})
+                        entry['Amount'] += amount
+                        # Like Cost Explorer, label sums over different units (Hrs, GB, ...) N/A
+                        if entry['Unit'] != unit:
+                            entry['Unit'] = 'N/A'
+        
+        for bucket in [totals, *by_usage_type.values()]:
+            for entry in bucket.values():
+                entry['Amount'] = str(entry['Amount'])
+        
+        return {
+            'ResourceId': resource_id,
+            'Total': totals,
+            'ByUsageType': by_usage_type,
+            'ResultsByTime': response.get('ResultsByTime', [])
+        }
+
+
+def to_dataframe(response: Dict[str, Any], metric: str = 'BlendedCost'):
+    """
+    Flatten a grouped cost and usage response into a pandas DataFrame.
+    
+    Produces one row per group per time period, with the group 'Keys' tuple, the
+    'TimePeriod.Start'/'TimePeriod.End' of the period, every returned metric
+    as 'Metrics.<name>.Amount'/'Metrics.<name>.Unit' columns, and a numeric
+    'Amount' column for the selected metric. Requires the optional pandas package.
+    
+    Args:
+        response: Response from get_cost_and_usage or one of the grouped helpers
+        metric: Metric whose amount is converted into the numeric 'Amount' column
+        
+    Returns:
+        pandas.DataFrame with one row per group and time period
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("to_dataframe requires pandas; install it with 'pip install pandas'") from None
+    
+    df = pd.json_normalize(
+        response.get('ResultsByTime', []),
+        record_path=['Groups'],
+        meta=[['TimePeriod', 'Start'], ['TimePeriod', 'End']]
+    )
+    if df.empty:
+        df['Amount'] = pd.Series(dtype='float64')
+        return df
+    # Tuples rather than lists, so the group keys can be used with groupby
+    df['Keys'] = df['Keys'].map(tuple)
+    # Keep full float64 precision: these are currency amounts that get summed
+    df['Amount'] = pd.to_numeric(df[f'Metrics.{metric}.Amount'])
+    return df
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+AWS Billing API (asyncio) - Async variants of the AWS Billing API for use inside an event loop.
+
+Requires the optional aioboto3 package (pip install aioboto3).
+"""
+
+import asyncio
+import datetime
+from typing import Dict, List, Sequence, Union, Optional, Any
+import logging
+
+from aws_billing_api import (
+    _CE_CLIENT_CONFIG,
+    _GROUP_BY_ACCOUNT,
+    _GROUP_BY_REGION,
+    _GROUP_BY_SERVICE,
+    _build_cost_and_usage_params,
+    _hourly_windows,
+    _merge_page,
+    _prepare_request,
+    _stitch_windows,
+)
+
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+logger = logging.getLogger('aws_billing_api')
+
+
+class AsyncAWSBillingAPI:
+    """
+    Async API for accessing AWS billing information based on date range.
+    
+    Requests are prepared, validated and split into HOURLY windows exactly as in
+    AWSBillingAPI, but responses are not cached: every call is a billed request.
+    
+    Note that aioboto3 pins a specific aiobotocore, which in turn pins botocore,
+    so it may constrain the boto3 version installed alongside it.
+    """
+    
+    def __init__(self, profile_name: Optional[str] = None, region_name: str = 'us-east-1'):
+        """
+        Initialize the async AWS Billing API.
+        
+        Args:
+            profile_name: AWS profile name to use. If None, default profile is used.
+            region_name: AWS region name to use.
+        """
+        if aioboto3 is None:
+            raise ImportError(
+                "AsyncAWSBillingAPI requires aioboto3; install it with 'pip install aioboto3'"
+            )
+        self.session = aioboto3.Session(profile_name=profile_name, region_name=region_name)
+        logger.info("Initialized async AWS Billing API with region: %s", region_name)
+    
+    def _client(self):
+        """Return an async context manager yielding a Cost Explorer client."""
+        return self.session.client('ce', config=_CE_CLIENT_CONFIG)
+    
+    async def _invoke(self, ce_client, op_name: str, **params) -> Dict[str, Any]:
+        """
+        Call a Cost Explorer operation on an open client and return its complete response.
+        
+        The TimePeriod is normalized and validated exactly as in AWSBillingAPI._invoke,
+        then NextPageToken is followed and every page merged into one response.
+        
+        Args:
+            ce_client: Open aioboto3 Cost Explorer client
+            op_name: Name of the Cost Explorer client method, e.g. 'get_cost_and_usage'
+            **params: Request parameters for the operation
+        
+        Returns:
+            Dict containing the response, with all result pages merged
+        
+        Raises:
+            ValueError: If Cost Explorer would refuse the time period
+        """
+        start_date, end_date = _prepare_request(op_name, params)
+        
+        try:
+            logger.info("Calling %s from %s to %s", op_name, start_date, end_date)
+            method = getattr(ce_client, op_name)
+            merged = None
+            next_token = None
+            while True:
+                if next_token:
+                    params['NextPageToken'] = next_token
+                response = await method(**params)
+                merged = _merge_page(merged, response)
+                next_token = response.get('NextPageToken')
+                if not next_token:
+                    break
+            merged.pop('NextPageToken', None)
+            return merged
+        except Exception:
+            logger.exception("Error calling %s", op_name)
+            raise
+    
+    async def get_cost_and_usage(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        granularity: str = 'DAILY',
+        metrics: List[str] = None,
+        group_by: List[Dict[str, str]] = None,
+        filter_expression: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Get cost and usage data for the specified date range.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+            metrics: List of metrics to include (defaults to ["BlendedCost", "UnblendedCost", "UsageQuantity"])
+            group_by: List of grouping dimensions
+            filter_expression: Cost Explorer filter expression
+        
+        Returns:
+            Dict containing the cost and usage data, with all result pages merged
+        """
+        params = _build_cost_and_usage_params(
+            start_date, end_date, granularity, metrics, group_by, filter_expression
+        )
+        async with self._client() as ce_client:
+            return await self._get_windows(ce_client, params)
+    
+    async def _get_windows(self, ce_client, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GetCostAndUsage request, split into concurrent HOURLY windows when needed.
+        
+        An HOURLY period longer than Cost Explorer allows is requested as windows of
+        at most _HOURLY_MAX_DAYS days, and the results are stitched back together in order.
+        """
+        responses = await asyncio.gather(*[
+            self._invoke(ce_client, 'get_cost_and_usage', **window)
+            for window in _hourly_windows(params)
+        ])
+        return _stitch_windows(responses)
+    
+    async def get_cost_by_service(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        granularity: str = 'MONTHLY'
+    ) -> Dict[str, Any]:
+        """
+        Get cost data grouped by service for the specified date range.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+        
+        Returns:
+            Dict containing the cost data grouped by service
+        """
+        return await self.get_cost_and_usage(
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            group_by=_GROUP_BY_SERVICE
+        )
+    
+    async def get_cost_by_account(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        granularity: str = 'MONTHLY'
+    ) -> Dict[str, Any]:
+        """
+        Get cost data grouped by account for the specified date range.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+        
+        Returns:
+            Dict containing the cost data grouped by account
+        """
+        return await self.get_cost_and_usage(
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            group_by=_GROUP_BY_ACCOUNT
+        )
+    
+    async def get_cost_by_region(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        granularity: str = 'MONTHLY'
+    ) -> Dict[str, Any]:
+        """
+        Get cost data grouped by region for the specified date range.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+        
+        Returns:
+            Dict containing the cost data grouped by region
+        """
+        return await self.get_cost_and_usage(
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            group_by=_GROUP_BY_REGION
+        )
+    
+    async def get_cost_breakdowns(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        dimensions: Sequence[str] = ('SERVICE', 'LINKED_ACCOUNT', 'REGION'),
+        granularity: str = 'MONTHLY'
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cost data grouped by each of several dimensions, fetched concurrently.
+        
+        All requests, including the windows of long HOURLY periods, share one
+        client and run concurrently on the event loop.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            dimensions: Cost Explorer dimension keys to group by, one request each
+            granularity: Time granularity of the data (DAILY, MONTHLY, or HOURLY)
+        
+        Returns:
+            Dict mapping each dimension to its cost and usage response
+        """
+        async with self._client() as ce_client:
+            responses = await asyncio.gather(*[
+                self._get_windows(
+                    ce_client,
+                    _build_cost_and_usage_params(
+                        start_date,
+                        end_date,
+                        granularity,
+                        None,
+                        [{'Type': 'DIMENSION', 'Key': dimension}],
+                        None
+                    )
+                )
+                for dimension in dimensions
+            ])
+        return dict(zip(dimensions, responses))
+    
+    async def get_cost_forecast(
+        self,
+        start_date: Union[str, datetime.date],
+        end_date: Union[str, datetime.date],
+        granularity: str = 'MONTHLY',
+        metric: str = 'UNBLENDED_COST'
+    ) -> Dict[str, Any]:
+        """
+        Get cost forecast for the specified date range.
+        
+        Args:
+            start_date: Start date in 'YYYY-MM-DD' format or as datetime.date object
+            end_date: End date in 'YYYY-MM-DD' format or as datetime.date object
+            granularity: Time granularity of the data (DAILY or MONTHLY)
+            metric: Forecast metric (UNBLENDED_COST, BLENDED_COST, AMORTIZED_COST, NET_UNBLENDED_COST, NET_AMORTIZED_COST)
+        
+        Returns:
+            Dict containing the cost forecast data
+        """
+        async with self._client() as ce_client:
+            return await self._invoke(
+                ce_client,
+                'get_cost_forecast',
+                TimePeriod={
+                    'Start': start_date,
+                    'End': end_date
+                },
+                Granularity=granularity,
+                Metric=metric
+            )
@@ -5,119 +5,330 @@ Command-line interface for the AWS Billing API.
 
 import argparse
 import datetime
+import functools
 import json
+import sqlite3
 import sys
-from dateutil.parser import parse
-from dateutil.relativedelta import relativedelta
-from aws_billing_api import AWSBillingAPI
-import config
+from config import AWS_PROFILE, AWS_REGION, CLI_CACHE_DIR, CLI_CACHE_TTL, DATE_FORMAT
+from formatting import format_cost
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Allowed values for --granularity and --metric, shared by the subparsers
+_GRAN_ALL = ('DAILY', 'MONTHLY', 'HOURLY')
+_GRAN_DM = ('DAILY', 'MONTHLY')
+_FORECAST_METRICS = ('UNBLENDED_COST', 'BLENDED_COST', 'AMORTIZED_COST')
+
+@functools.lru_cache(maxsize=256)
+def _parse_absolute(date_str):
+    """Parse a literal date string into a datetime.date object, raising ValueError if invalid"""
+    # Fast paths for the documented YYYY-MM-DD form before falling back to
+    # dateutil, which has to guess the format
+    try:
+        return datetime.date.fromisoformat(date_str)
+    except ValueError:
+        pass
+    try:
+        return datetime.datetime.strptime(date_str, DATE_FORMAT).date()
+    except ValueError:
+        pass
+    # dateutil is only imported for input the fast paths cannot handle
+    from dateutil.parser import parse
+    return parse(date_str).date()
+
+# Relative date keywords accepted by parse_date, each computed from today's date
+_DATE_KEYWORDS = {
+    'today': lambda today: today,
+    'yesterday': lambda today: today - datetime.timedelta(days=1),
+    'month_start': lambda today: today.replace(day=1),
+    # Day 28 plus 4 days always lands in the next month
+    'month_end': lambda today: (today.replace(day=28) + datetime.timedelta(days=4)).replace(day=1) - datetime.timedelta(days=1),
+    'year_start': lambda today: today.replace(month=1, day=1),
+}
 
 def parse_date(date_str):
     """Parse date string into datetime.date object"""
-    if date_str.lower() == 'today':
-        return datetime.date.today()
-    elif date_str.lower() == 'yesterday':
-        return datetime.date.today() - datetime.timedelta(days=1)
-    elif date_str.lower() == 'month_start':
-        today = datetime.date.today()
-        return today.replace(day=1)
-    elif date_str.lower() == 'month_end':
-        today = datetime.date.today()
-        next_month = today.replace(day=1) + relativedelta(months=1)
-        return next_month - datetime.timedelta(days=1)
-    elif date_str.lower() == 'year_start':
-        today = datetime.date.today()
-        return today.replace(month=1, day=1)
+    # Keywords depend on the current date, so only literal dates are cached.
+    # Every keyword starts with a letter, so numeric dates skip the lookup.
+    if not date_str[:1].isdigit():
+        keyword = _DATE_KEYWORDS.get(date_str.lower())
+        if keyword is not None:
+            return keyword(datetime.date.today())
+    try:
+        return _parse_absolute(date_str)
+    except ValueError:
+        print(f"Error: Invalid date format '{date_str}'")
+        sys.exit(1)
+
+def print_json(data):
+    """Print data as JSON, indented for a terminal and compact when piped"""
+    pretty = sys.stdout.isatty()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        encoded = orjson.dumps(data, option=option, default=str) + b"\n"
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            # Text-only stdout, e.g. redirected to io.StringIO by an in-process caller
+            sys.stdout.write(encoded.decode())
+            return
+        # Write the encoded bytes directly, skipping the text encoding layer
+        sys.stdout.flush()
+        buffer.write(encoded)
+        buffer.flush()
+    elif pretty:
+        print(json.dumps(data, indent=2, ensure_ascii=False, default=str))
     else:
+        print(json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str))
+
+def _print_totals(response, header, period_label='Period'):
+    """Print the per-period totals of every metric in a cost and usage response"""
+    lines = [f"\n=== {header} ==="]
+    for result in response.get('ResultsByTime', []):
+        time_period = result.get('TimePeriod', {})
+        lines.append(f"\n{period_label}: {time_period.get('Start')} to {time_period.get('End')}")
+        lines.extend(
+            f"  {metric}: {format_cost(cost_data)}"
+            for metric, cost_data in result.get('Total', {}).items()
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _print_grouped(response, header, label_fn=str):
+    """Print the blended cost of each group per period, labelling each group key with label_fn"""
+    lines = [f"\n=== {header} ==="]
+    for result in response.get('ResultsByTime', []):
+        time_period = result.get('TimePeriod', {})
+        lines.append(f"\nPeriod: {time_period.get('Start')} to {time_period.get('End')}")
+        for group in result.get('Groups', []):
+            label = label_fn(group.get('Keys', ['Unknown'])[0])
+            blended_cost = group.get('Metrics', {}).get('BlendedCost', {})
+            lines.append(f"  {label}: {format_cost(blended_cost)}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+@functools.lru_cache(maxsize=8)
+def _get_api(profile_name, region_name, cache_ttl, disk_cache_dir):
+    """Create the AWSBillingAPI for a profile, region and cache settings once per process"""
+    # Imported only once a command will run: boto3 dominates CLI startup time
+    from aws_billing_api import AWSBillingAPI
+    if disk_cache_dir is not None and cache_ttl:
         try:
-            return parse(date_str).date()
-        except ValueError:
-            print(f"Error: Invalid date format '{date_str}'")
-            sys.exit(1)
+            return AWSBillingAPI(
+                profile_name=profile_name,
+                region_name=region_name,
+                cache_ttl=cache_ttl,
+                disk_cache_dir=disk_cache_dir,
+                disk_cache_ttl=cache_ttl,
+                disk_cache_final_ttl=cache_ttl
+            )
+        except (ImportError, OSError, sqlite3.Error) as e:
+            # The disk cache only saves requests, so a missing diskcache or an
+            # unwritable directory (e.g. a read-only home on Lambda) is not fatal
+            print(f"Warning: caching responses in memory only ({e})", file=sys.stderr)
+    return AWSBillingAPI(profile_name=profile_name, region_name=region_name, cache_ttl=cache_ttl)
 
-def format_cost(cost_data):
-    """Format cost data for display"""
-    amount = float(cost_data.get('Amount', 0))
-    unit = cost_data.get('Unit', 'USD')
-    return f"{amount:.2f} {unit}"
+def billing_api(profile_name=AWS_PROFILE, region_name=AWS_REGION, cache_ttl=CLI_CACHE_TTL, disk_cache_dir=None):
+    """
+    Return the shared AWSBillingAPI for a profile and region.
+    
+    In-process callers (e.g. Lambda handlers on warm starts) reuse the same
+    instance, and with it the same boto3 client and response cache. Identical
+    queries within cache_ttl seconds are answered from that cache; 0 disables it.
+    If disk_cache_dir is given, responses are also persisted there for
+    cache_ttl seconds, so later processes can reuse them (requires diskcache).
+    """
+    return _get_api(profile_name, region_name, cache_ttl, disk_cache_dir)
 
-def print_json(data):
-    """Print data as formatted JSON"""
-    print(json.dumps(data, indent=2, default=str))
+def _cmd_cost(args, api):
+    """Fetch data for the 'cost' command"""
+    return api.get_cost_and_usage(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        granularity=args.granularity
+    )
+
+def _show_cost(args, response):
+    """Display the 'cost' command result"""
+    _print_totals(response, f"Cost for {args.start_date} to {args.end_date}")
+
+def _cmd_service(args, api):
+    """Fetch data for the 'service' command"""
+    return api.get_cost_by_service(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        granularity=args.granularity
+    )
+
+def _show_service(args, response):
+    """Display the 'service' command result"""
+    _print_grouped(response, f"Costs by service for {args.start_date} to {args.end_date}")
+
+def _cmd_account(args, api):
+    """Fetch data for the 'account' command"""
+    return api.get_cost_by_account(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        granularity=args.granularity
+    )
+
+def _show_account(args, response):
+    """Display the 'account' command result"""
+    _print_grouped(response, f"Costs by account for {args.start_date} to {args.end_date}", lambda account: f"Account {account}")
+
+def _cmd_region(args, api):
+    """Fetch data for the 'region' command"""
+    return api.get_cost_by_region(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        granularity=args.granularity
+    )
+
+def _show_region(args, response):
+    """Display the 'region' command result"""
+    _print_grouped(response, f"Costs by region for {args.start_date} to {args.end_date}")
+
+def _cmd_resource(args, api):
+    """Fetch data for the 'resource' command"""
+    # Combine single resource ID and list if both are provided
+    resource_ids = []
+    if args.resource_id:
+        resource_ids.append(args.resource_id)
+    if args.resource_ids:
+        resource_ids.extend(args.resource_ids)
+        
+    return api.get_cost_by_resource_id(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        resource_ids=resource_ids if resource_ids else None,
+        granularity=args.granularity
+    )
+
+def _show_resource(args, response):
+    """Display the 'resource' command result"""
+    _print_grouped(response, f"Costs by resource ID for {args.start_date} to {args.end_date}")
+
+def _cmd_utilization(args, api):
+    """Fetch data for the 'utilization' command"""
+    return api.get_resource_utilization(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        resource_id=args.resource_id,
+        granularity=args.granularity
+    )
+
+def _show_utilization(args, response):
+    """Display the 'utilization' command result"""
+    _print_totals(response, f"Resource utilization for {args.resource_id} from {args.start_date} to {args.end_date}")
+
+def _cmd_tag(args, api):
+    """Fetch data for the 'tag' command"""
+    return api.get_cost_by_resource_tags(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        tag_key=args.tag_key,
+        tag_values=args.tag_values,
+        granularity=args.granularity
+    )
+
+def _show_tag(args, response):
+    """Display the 'tag' command result"""
+    _print_grouped(response, f"Costs by tag '{args.tag_key}' for {args.start_date} to {args.end_date}", lambda tag_value: f"{args.tag_key}={tag_value}")
+
+def _cmd_forecast(args, api):
+    """Fetch data for the 'forecast' command"""
+    return api.get_cost_forecast(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        granularity=args.granularity,
+        metric=args.metric
+    )
+
+def _show_forecast(args, response):
+    """Display the 'forecast' command result"""
+    total = response.get('Total', {})
+    forecast = total.get('Amount', 'N/A')
+    unit = total.get('Unit', 'USD')
+    sys.stdout.write(
+        f"\n=== Cost forecast for {args.start_date} to {args.end_date} ===\n"
+        f"Forecasted cost: {forecast} {unit}\n"
+    )
+
+def _cmd_summary(args, api):
+    """Fetch data for the 'summary' command"""
+    return api.get_monthly_cost_summary(args.months)
+
+def _show_summary(args, response):
+    """Display the 'summary' command result"""
+    _print_totals(response, f"Monthly cost summary for the last {args.months} months", period_label='Month')
 
 def main():
     parser = argparse.ArgumentParser(description='AWS Billing API CLI')
     parser.add_argument('--profile', help='AWS profile name')
-    parser.add_argument('--region', default=config.AWS_REGION, help='AWS region name')
+    parser.add_argument('--region', default=AWS_REGION, help='AWS region name')
+    parser.add_argument('--no-cache', dest='cache', action='store_false', help='Always query Cost Explorer instead of reusing cached responses')
+    parser.add_argument('--cache-dir', default=CLI_CACHE_DIR, help=f'Directory to persist responses in for {CLI_CACHE_TTL}s across runs (requires diskcache)')
+    
+    # Arguments shared by the subcommands, defined once and inherited via parents=
+    date_range = argparse.ArgumentParser(add_help=False)
+    date_range.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
+    date_range.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
+    
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument('--json', action='store_true', help='Output in JSON format')
     
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
     
     # Cost and usage command
-    cost_parser = subparsers.add_parser('cost', help='Get cost and usage data')
-    cost_parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    cost_parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    cost_parser.add_argument('--granularity', default='DAILY', choices=['DAILY', 'MONTHLY', 'HOURLY'], help='Time granularity')
-    cost_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    cost_parser = subparsers.add_parser('cost', parents=[date_range, output], help='Get cost and usage data')
+    cost_parser.add_argument('--granularity', default='DAILY', choices=_GRAN_ALL, help='Time granularity')
+    cost_parser.set_defaults(func=_cmd_cost, show=_show_cost)
     
     # Cost by service command
-    service_parser = subparsers.add_parser('service', help='Get cost by service')
-    service_parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    service_parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    service_parser.add_argument('--granularity', default='MONTHLY', choices=['DAILY', 'MONTHLY'], help='Time granularity')
-    service_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    service_parser = subparsers.add_parser('service', parents=[date_range, output], help='Get cost by service')
+    service_parser.add_argument('--granularity', default='MONTHLY', choices=_GRAN_DM, help='Time granularity')
+    service_parser.set_defaults(func=_cmd_service, show=_show_service)
     
     # Cost by account command
-    account_parser = subparsers.add_parser('account', help='Get cost by account')
-    account_parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    account_parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    account_parser.add_argument('--granularity', default='MONTHLY', choices=['DAILY', 'MONTHLY'], help='Time granularity')
-    account_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    account_parser = subparsers.add_parser('account', parents=[date_range, output], help='Get cost by account')
+    account_parser.add_argument('--granularity', default='MONTHLY', choices=_GRAN_DM, help='Time granularity')
+    account_parser.set_defaults(func=_cmd_account, show=_show_account)
     
     # Cost by region command
-    region_parser = subparsers.add_parser('region', help='Get cost by region')
-    region_parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    region_parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    region_parser.add_argument('--granularity', default='MONTHLY', choices=['DAILY', 'MONTHLY'], help='Time granularity')
-    region_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    region_parser = subparsers.add_parser('region', parents=[date_range, output], help='Get cost by region')
+    region_parser.add_argument('--granularity', default='MONTHLY', choices=_GRAN_DM, help='Time granularity')
+    region_parser.set_defaults(func=_cmd_region, show=_show_region)
     
     # Cost by resource ID command
-    resource_parser = subparsers.add_parser('resource', help='Get cost by resource ID')
-    resource_parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    resource_parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
+    resource_parser = subparsers.add_parser('resource', parents=[date_range, output], help='Get cost by resource ID')
     resource_parser.add_argument('--resource-id', help='Specific resource ID to filter by')
     resource_parser.add_argument('--resource-ids', nargs='+', help='List of resource IDs to filter by')
-    resource_parser.add_argument('--granularity', default='DAILY', choices=['DAILY', 'MONTHLY', 'HOURLY'], help='Time granularity')
-    resource_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    resource_parser.add_argument('--granularity', default='DAILY', choices=_GRAN_ALL, help='Time granularity')
+    resource_parser.set_defaults(func=_cmd_resource, show=_show_resource)
     
     # Resource utilization command
-    utilization_parser = subparsers.add_parser('utilization', help='Get detailed utilization for a specific resource')
-    utilization_parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    utilization_parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
+    utilization_parser = subparsers.add_parser('utilization', parents=[date_range, output], help='Get detailed utilization for a specific resource')
     utilization_parser.add_argument('--resource-id', required=True, help='Resource ID to analyze')
-    utilization_parser.add_argument('--granularity', default='DAILY', choices=['DAILY', 'MONTHLY', 'HOURLY'], help='Time granularity')
-    utilization_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    utilization_parser.add_argument('--granularity', default='DAILY', choices=_GRAN_ALL, help='Time granularity')
+    utilization_parser.set_defaults(func=_cmd_utilization, show=_show_utilization)
     
     # Cost by tag command
-    tag_parser = subparsers.add_parser('tag', help='Get cost by resource tag')
-    tag_parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    tag_parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
+    tag_parser = subparsers.add_parser('tag', parents=[date_range, output], help='Get cost by resource tag')
     tag_parser.add_argument('--tag-key', required=True, help='Tag key to group by')
     tag_parser.add_argument('--tag-values', nargs='+', help='List of tag values to filter by')
-    tag_parser.add_argument('--granularity', default='DAILY', choices=['DAILY', 'MONTHLY'], help='Time granularity')
-    tag_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    tag_parser.add_argument('--granularity', default='DAILY', choices=_GRAN_DM, help='Time granularity')
+    tag_parser.set_defaults(func=_cmd_tag, show=_show_tag)
     
     # Forecast command
-    forecast_parser = subparsers.add_parser('forecast', help='Get cost forecast')
-    forecast_parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    forecast_parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD or special: today, yesterday, month_start, month_end, year_start)')
-    forecast_parser.add_argument('--granularity', default='MONTHLY', choices=['DAILY', 'MONTHLY'], help='Time granularity')
-    forecast_parser.add_argument('--metric', default='UNBLENDED_COST', choices=['UNBLENDED_COST', 'BLENDED_COST', 'AMORTIZED_COST'], help='Forecast metric')
-    forecast_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    forecast_parser = subparsers.add_parser('forecast', parents=[date_range, output], help='Get cost forecast')
+    forecast_parser.add_argument('--granularity', default='MONTHLY', choices=_GRAN_DM, help='Time granularity')
+    forecast_parser.add_argument('--metric', default='UNBLENDED_COST', choices=_FORECAST_METRICS, help='Forecast metric')
+    forecast_parser.set_defaults(func=_cmd_forecast, show=_show_forecast)
     
     # Summary command
-    summary_parser = subparsers.add_parser('summary', help='Get monthly cost summary')
+    summary_parser = subparsers.add_parser('summary', parents=[output], help='Get monthly cost summary')
     summary_parser.add_argument('--months', type=int, default=6, help='Number of months to look back')
-    summary_parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    summary_parser.set_defaults(func=_cmd_summary, show=_show_summary)
     
     args = parser.parse_args()
     
@@ -125,240 +336,31 @@ def main():
         parser.print_help()
         sys.exit(1)
     
-    # Initialize the API
-    billing_api = AWSBillingAPI(
-        profile_name=args.profile,
-        region_name=args.region
-    )
+    # Parse the date range once for every command that takes one
+    if hasattr(args, 'start_date'):
+        args.start_date = parse_date(args.start_date)
+        args.end_date = parse_date(args.end_date)
     
-    try:
-        if args.command == 'cost':
-            start_date = parse_date(args.start_date)
-            end_date = parse_date(args.end_date)
-            response = billing_api.get_cost_and_usage(
-                start_date=start_date,
-                end_date=end_date,
-                granularity=args.granularity
-            )
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Cost for {start_date} to {end_date} ===")
-                for result in response.get('ResultsByTime', []):
-                    time_period = result.get('TimePeriod', {})
-                    start = time_period.get('Start')
-                    end = time_period.get('End')
-                    costs = result.get('Total', {})
-                    
-                    print(f"\nPeriod: {start} to {end}")
-                    for metric, cost_data in costs.items():
-                        print(f"  {metric}: {format_cost(cost_data)}")
-        
-        elif args.command == 'service':
-            start_date = parse_date(args.start_date)
-            end_date = parse_date(args.end_date)
-            response = billing_api.get_cost_by_service(
-                start_date=start_date,
-                end_date=end_date,
-                granularity=args.granularity
-            )
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Costs by service for {start_date} to {end_date} ===")
-                for result in response.get('ResultsByTime', []):
-                    time_period = result.get('TimePeriod', {})
-                    start = time_period.get('Start')
-                    end = time_period.get('End')
-                    groups = result.get('Groups', [])
-                    
-                    print(f"\nPeriod: {start} to {end}")
-                    for group in groups:
-                        service = group.get('Keys', ['Unknown'])[0]
-                        metrics = group.get('Metrics', {})
-                        blended_cost = metrics.get('BlendedCost', {})
-                        print(f"  {service}: {format_cost(blended_cost)}")
-        
-        elif args.command == 'account':
-            start_date = parse_date(args.start_date)
-            end_date = parse_date(args.end_date)
-            response = billing_api.get_cost_by_account(
-                start_date=start_date,
-                end_date=end_date,
-                granularity=args.granularity
-            )
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Costs by account for {start_date} to {end_date} ===")
-                for result in response.get('ResultsByTime', []):
-                    time_period = result.get('TimePeriod', {})
-                    start = time_period.get('Start')
-                    end = time_period.get('End')
-                    groups = result.get('Groups', [])
-                    
-                    print(f"\nPeriod: {start} to {end}")
-                    for group in groups:
-                        account = group.get('Keys', ['Unknown'])[0]
-                        metrics = group.get('Metrics', {})
-                        blended_cost = metrics.get('BlendedCost', {})
-                        print(f"  Account {account}: {format_cost(blended_cost)}")
-        
-        elif args.command == 'region':
-            start_date = parse_date(args.start_date)
-            end_date = parse_date(args.end_date)
-            response = billing_api.get_cost_by_region(
-                start_date=start_date,
-                end_date=end_date,
-                granularity=args.granularity
-            )
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Costs by region for {start_date} to {end_date} ===")
-                for result in response.get('ResultsByTime', []):
-                    time_period = result.get('TimePeriod', {})
-                    start = time_period.get('Start')
-                    end = time_period.get('End')
-                    groups = result.get('Groups', [])
-                    
-                    print(f"\nPeriod: {start} to {end}")
-                    for group in groups:
-                        region = group.get('Keys', ['Unknown'])[0]
-                        metrics = group.get('Metrics', {})
-                        blended_cost = metrics.get('BlendedCost', {})
-                        print(f"  {region}: {format_cost(blended_cost)}")
-        
-        elif args.command == 'resource':
-            start_date = parse_date(args.start_date)
-            end_date = parse_date(args.end_date)
-            
-            # Combine single resource ID and list if both are provided
-            resource_ids = []
-            if args.resource_id:
-                resource_ids.append(args.resource_id)
-            if args.resource_ids:
-                resource_ids.extend(args.resource_ids)
-                
-            response = billing_api.get_cost_by_resource_id(
-                start_date=start_date,
-                end_date=end_date,
-                resource_ids=resource_ids if resource_ids else None,
-                granularity=args.granularity
-            )
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Costs by resource ID for {start_date} to {end_date} ===")
-                for result in response.get('ResultsByTime', []):
-                    time_period = result.get('TimePeriod', {})
-                    start = time_period.get('Start')
-                    end = time_period.get('End')
-                    groups = result.get('Groups', [])
-                    
-                    print(f"\nPeriod: {start} to {end}")
-                    for group in groups:
-                        resource_id = group.get('Keys', ['Unknown'])[0]
-                        metrics = group.get('Metrics', {})
-                        blended_cost = metrics.get('BlendedCost', {})
-                        print(f"  {resource_id}: {format_cost(blended_cost)}")
-        
-        elif args.command == 'utilization':
-            start_date = parse_date(args.start_date)
-            end_date = parse_date(args.end_date)
-            response = billing_api.get_resource_utilization(
-                start_date=start_date,
-                end_date=end_date,
-                resource_id=args.resource_id,
-                granularity=args.granularity
-            )
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Resource utilization for {args.resource_id} from {start_date} to {end_date} ===")
-                for result in response.get('ResultsByTime', []):
-                    time_period = result.get('TimePeriod', {})
-                    start = time_period.get('Start')
-                    end = time_period.get('End')
-                    costs = result.get('Total', {})
-                    
-                    print(f"\nPeriod: {start} to {end}")
-                    for metric, cost_data in costs.items():
-                        print(f"  {metric}: {format_cost(cost_data)}")
-        
-        elif args.command == 'tag':
-            start_date = parse_date(args.start_date)
-            end_date = parse_date(args.end_date)
-            response = billing_api.get_cost_by_resource_tags(
-                start_date=start_date,
-                end_date=end_date,
-                tag_key=args.tag_key,
-                tag_values=args.tag_values,
-                granularity=args.granularity
-            )
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Costs by tag '{args.tag_key}' for {start_date} to {end_date} ===")
-                for result in response.get('ResultsByTime', []):
-                    time_period = result.get('TimePeriod', {})
-                    start = time_period.get('Start')
-                    end = time_period.get('End')
-                    groups = result.get('Groups', [])
-                    
-                    print(f"\nPeriod: {start} to {end}")
-                    for group in groups:
-                        tag_value = group.get('Keys', ['Unknown'])[0]
-                        metrics = group.get('Metrics', {})
-                        blended_cost = metrics.get('BlendedCost', {})
-                        print(f"  {args.tag_key}={tag_value}: {format_cost(blended_cost)}")
-        
-        elif args.command == 'forecast':
-            start_date = parse_date(args.start_date)
-            end_date = parse_date(args.end_date)
-            response = billing_api.get_cost_forecast(
-                start_date=start_date,
-                end_date=end_date,
-                granularity=args.granularity,
-                metric=args.metric
-            )
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Cost forecast for {start_date} to {end_date} ===")
-                total = response.get('Total', {})
-                forecast = total.get('Amount', 'N/A')
-                unit = total.get('Unit', 'USD')
-                print(f"Forecasted cost: {forecast} {unit}")
-        
-        elif args.command == 'summary':
-            response = billing_api.get_monthly_cost_summary(args.months)
-            
-            if args.json:
-                print_json(response)
-            else:
-                print(f"\n=== Monthly cost summary for the last {args.months} months ===")
-                for result in response.get('ResultsByTime', []):
-                    time_period = result.get('TimePeriod', {})
-                    start = time_period.get('Start')
-                    end = time_period.get('End')
-                    costs = result.get('Total', {})
-                    
-                    print(f"\nMonth: {start} to {end}")
-                    for metric, cost_data in costs.items():
-                        print(f"  {metric}: {format_cost(cost_data)}")
+    # Initialize the API. Each run makes a single query, so repeats are only
+    # answered from a cache persisted by earlier runs (opt-in via --cache-dir)
+    if args.cache:
+        api = billing_api(args.profile, args.region, CLI_CACHE_TTL, args.cache_dir)
+    else:
+        api = billing_api(args.profile, args.region, 0)
     
-    except Exception as e:
+    from botocore.exceptions import BotoCoreError, ClientError
+    
+    # Only the AWS call is guarded; errors while printing are not API errors
+    try:
+        response = args.func(args, api)
+    except (BotoCoreError, ClientError, ValueError) as e:
         print(f"Error: {str(e)}")
         sys.exit(1)
+    
+    if args.json:
+        print_json(response)
+    else:
+        args.show(args, response)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
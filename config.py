@@ -2,6 +2,8 @@
 Configuration settings for AWS Billing API.
 """
 
+import os
+
 # AWS profile to use (None for default)
 AWS_PROFILE = None
 
@@ -15,4 +17,14 @@ DATE_FORMAT = '%Y-%m-%d'
 DEFAULT_METRICS = ["BlendedCost", "UnblendedCost", "UsageQuantity"]
 
 # Default granularity for cost data
-DEFAULT_GRANULARITY = 'DAILY'
\ No newline at end of file
+DEFAULT_GRANULARITY = 'DAILY'
+
+# Seconds the CLI reuses the response of an identical query
+CLI_CACHE_TTL = 60
+
+# Directory in which the CLI persists responses across runs for CLI_CACHE_TTL
+# seconds (requires diskcache). None keeps them in memory only; --cache-dir overrides it.
+CLI_CACHE_DIR = None
+
+# Directory for persisting Cost Explorer responses across runs (requires diskcache)
+DISK_CACHE_DIR = os.path.expanduser('~/.cache/aws-billing-api')
\ No newline at end of file
@@ -4,22 +4,22 @@ Example usage of the AWS Billing API.
 """
 
 import datetime
+import heapq
 from dateutil.relativedelta import relativedelta
 import json
 from aws_billing_api import AWSBillingAPI
-import config
+from config import AWS_PROFILE, AWS_REGION
+from formatting import format_cost
 
-def format_cost(cost_data):
-    """Format cost data for display"""
-    amount = float(cost_data.get('Amount', 0))
-    unit = cost_data.get('Unit', 'USD')
-    return f"{amount:.2f} {unit}"
+def blended_amount(group):
+    """Return the blended cost amount of a result group as a float"""
+    return float(group.get('Metrics', {}).get('BlendedCost', {}).get('Amount', 0))
 
 def main():
     # Initialize the API
     billing_api = AWSBillingAPI(
-        profile_name=config.AWS_PROFILE,
-        region_name=config.AWS_REGION
+        profile_name=AWS_PROFILE,
+        region_name=AWS_REGION
     )
     
     # Example 1: Get costs for the last 30 days
@@ -100,15 +100,11 @@ def main():
             groups = result.get('Groups', [])
             
             print(f"\nPeriod: {start} to {end}")
-            # Sort resources by cost (highest first)
-            sorted_groups = sorted(
-                groups, 
-                key=lambda g: float(g.get('Metrics', {}).get('BlendedCost', {}).get('Amount', 0)), 
-                reverse=True
-            )
+            # Select the 10 most expensive resources without sorting all of them
+            top_groups = heapq.nlargest(10, groups, key=blended_amount)
             
             # Print top 10 resources by cost
-            for i, group in enumerate(sorted_groups[:10]):
+            for i, group in enumerate(top_groups):
                 resource_id = group.get('Keys', ['Unknown'])[0]
                 metrics = group.get('Metrics', {})
                 blended_cost = metrics.get('BlendedCost', {})
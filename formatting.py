@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Display formatting helpers shared by the CLI and the example script.
+"""
+
+def format_cost(cost_data, _fmt="{:.2f} {}".format):
+    """Format cost data for display"""
+    # Cost Explorer amounts almost always carry both keys; index directly and
+    # only fall back to the defaults when one is missing
+    try:
+        return _fmt(float(cost_data['Amount']), cost_data['Unit'])
+    except KeyError:
+        return _fmt(float(cost_data.get('Amount', 0)), cost_data.get('Unit', 'USD'))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the AWS Billing API that run against a stub Cost Explorer client.
+"""
+
+import datetime
+import unittest
+
+from aws_billing_api import AWSBillingAPI
+
+
+class StubCostExplorer:
+    """Records the TimePeriod of every GetCostAndUsage request and echoes it back."""
+    
+    def __init__(self):
+        self.time_periods = []
+    
+    def get_cost_and_usage(self, **params):
+        self.time_periods.append(params['TimePeriod'])
+        return {'ResultsByTime': [{'TimePeriod': params['TimePeriod'], 'Estimated': False}]}
+
+
+class HourlyWindowTest(unittest.TestCase):
+    """Splitting of HOURLY periods longer than Cost Explorer accepts."""
+    
+    def setUp(self):
+        self.stub = StubCostExplorer()
+        self.api = AWSBillingAPI(cache_ttl=0)
+        self.api.ce_client = self.stub
+    
+    def test_date_bounds_split_into_14_day_windows(self):
+        response = self.api.get_cost_and_usage('2024-01-01', '2024-02-01', granularity='HOURLY')
+        expected = [
+            {'Start': '2024-01-01', 'End': '2024-01-15'},
+            {'Start': '2024-01-15', 'End': '2024-01-29'},
+            {'Start': '2024-01-29', 'End': '2024-02-01'},
+        ]
+        self.assertCountEqual(self.stub.time_periods, expected)
+        self.assertEqual([result['TimePeriod'] for result in response['ResultsByTime']], expected)
+    
+    def test_timestamp_bounds_keep_time_of_day(self):
+        self.api.get_cost_and_usage('2024-01-01T12:00:00Z', '2024-01-20T13:00:00Z', granularity='HOURLY')
+        self.assertCountEqual(self.stub.time_periods, [
+            {'Start': '2024-01-01T12:00:00Z', 'End': '2024-01-15T12:00:00Z'},
+            {'Start': '2024-01-15T12:00:00Z', 'End': '2024-01-20T13:00:00Z'},
+        ])
+    
+    def test_split_decided_on_full_duration(self):
+        # 14 days and one hour: one hour too long for a single request
+        self.api.get_cost_and_usage('2024-01-01T12:00:00Z', '2024-01-15T13:00:00Z', granularity='HOURLY')
+        self.assertCountEqual(self.stub.time_periods, [
+            {'Start': '2024-01-01T12:00:00Z', 'End': '2024-01-15T12:00:00Z'},
+            {'Start': '2024-01-15T12:00:00Z', 'End': '2024-01-15T13:00:00Z'},
+        ])
+    
+    def test_sub_day_datetime_bounds_are_sent_as_timestamps(self):
+        self.api.get_cost_and_usage(
+            datetime.datetime(2024, 1, 1, 12),
+            datetime.datetime(2024, 1, 1, 18),
+            granularity='HOURLY'
+        )
+        self.assertEqual(self.stub.time_periods, [
+            {'Start': '2024-01-01T12:00:00Z', 'End': '2024-01-01T18:00:00Z'},
+        ])
+    
+    def test_breakdowns_split_each_dimension(self):
+        breakdowns = self.api.get_cost_breakdowns(
+            '2024-01-01T12:00:00Z',
+            '2024-01-20T13:00:00Z',
+            dimensions=('SERVICE', 'REGION'),
+            granularity='HOURLY'
+        )
+        for response in breakdowns.values():
+            self.assertEqual(
+                [result['TimePeriod'] for result in response['ResultsByTime']],
+                [
+                    {'Start': '2024-01-01T12:00:00Z', 'End': '2024-01-15T12:00:00Z'},
+                    {'Start': '2024-01-15T12:00:00Z', 'End': '2024-01-20T13:00:00Z'},
+                ]
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()